@@ -16,9 +16,12 @@ Functions to read and write files
 import numpy as np
 import pandas as pd
 import datetime
-import glob
+import fnmatch
+import functools
 import os
 import sys
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 
 def read_aws(time, date_range=True, datadir='/disk/STORAGE/OBS/AWS/', stnid=None, dask=True):
     """
@@ -51,8 +54,6 @@ def read_aws(time, date_range=True, datadir='/disk/STORAGE/OBS/AWS/', stnid=None
     df_aws : dataframe
         Return dataframe of aws data.
     """
-    import dask.dataframe as dd
-    
     if time is None:
         sys.exit(f'{__name__}: Check time argument')
     
@@ -69,21 +70,19 @@ def read_aws(time, date_range=True, datadir='/disk/STORAGE/OBS/AWS/', stnid=None
         dt_finis = datetime.datetime(time[1].year, time[1].month, time[1].day, time[1].hour, time[1].minute)
         
         # Get file list
-        filearr = np.array([])
-        _dt = dt_start
+        filearr = []
+        _dt = datetime.datetime(dt_start.year, dt_start.month, dt_start.day)
         while _dt <= dt_finis:
-            _filearr = np.sort(glob.glob(f'{datadir}/{_dt:%Y%m}/{_dt:%d}/AWS_MIN_{_dt:%Y%m%d%H%M}'))
-            filearr = np.append(filearr, _filearr)
-            _dt = _dt + datetime.timedelta(minutes=1)
-        yyyy_filearr = [np.int(os.path.basename(x)[-12:-8]) for x in filearr]
-        mm_filearr = [np.int(os.path.basename(x)[-8:-6]) for x in filearr]
-        dd_filearr = [np.int(os.path.basename(x)[-6:-4]) for x in filearr]
-        hh_filearr = [np.int(os.path.basename(x)[-4:-2]) for x in filearr]
-        ii_filearr = [np.int(os.path.basename(x)[-2:]) for x in filearr]
-        dt_filearr = np.array([datetime.datetime(yyyy,mm,dd,hh,ii) for (yyyy,mm,dd,hh,ii) in zip(yyyy_filearr, mm_filearr, dd_filearr, hh_filearr, ii_filearr)])
-
-        filearr = filearr[(dt_filearr >= dt_start) & (dt_filearr <= dt_finis)]
-        dt_filearr = dt_filearr[(dt_filearr >= dt_start) & (dt_filearr <= dt_finis)]
+            filearr.extend(_list_files(f'{datadir}/{_dt:%Y%m}/{_dt:%d}', 'AWS_MIN_????????????'))
+            _dt = _dt + datetime.timedelta(days=1)
+        filearr = np.array(filearr)
+        dt_filearr = pd.to_datetime(pd.Series(filearr, dtype=object).str.slice(-12), format='%Y%m%d%H%M').to_numpy()
+        
+        # dt_filearr is sorted as days are listed in order
+        i_start = np.searchsorted(dt_filearr, np.datetime64(dt_start, 'ns'), side='left')
+        i_finis = np.searchsorted(dt_filearr, np.datetime64(dt_finis, 'ns'), side='right')
+        filearr = filearr[i_start:i_finis]
+        dt_filearr = dt_filearr[i_start:i_finis]
         
     else:
         list_dt_yyyymmddhhii = np.unique(np.array([datetime.datetime(_time.year, _time.month, _time.day, _time.hour, _time.minute) for _time in time]))
@@ -102,34 +101,46 @@ def read_aws(time, date_range=True, datadir='/disk/STORAGE/OBS/AWS/', stnid=None
              'R60mAcc', 'R1d', 'R15m', 'R60m',
              'WDS', 'WSS', 'dummy']
     
-    df_aws = dd.read_csv(filearr.tolist(), delimiter='#', names=names, header=None, na_values=[-999,-997])
-    df_aws = df_aws.drop('dummy', axis=1)
-    df_aws.WD      = df_aws.WD/10.
-    df_aws.WS      = df_aws.WS/10.
-    df_aws.T       = df_aws['T']/10.
-    df_aws.RH      = df_aws.RH/10.
-    df_aws.PA      = df_aws.PA/10.
-    df_aws.PS      = df_aws.PS/10.
-    df_aws.RE      = df_aws.RE/10.
-    df_aws.R60mAcc = df_aws.R60mAcc/10.
-    df_aws.R1d     = df_aws.R1d/10.
-    df_aws.R15m    = df_aws.R15m/10.
-    df_aws.R60m    = df_aws.R60m/10.
-    df_aws.WDS     = df_aws.WDS/10.
-    df_aws.WSS     = df_aws.WSS/10.
-    if stnid:
-        df_aws = df_aws[df_aws['ID'].isin(stnid)]
-
-    df_aws = df_aws.set_index(dd.to_datetime(df_aws['YMDHI'], format='%Y%m%d%H%M'))
-    df_aws = df_aws.drop('YMDHI', axis=1)
-    
     if dask:
-        return df_aws
+        import dask.dataframe as dd
+        
+        df_aws = dd.read_csv(filearr.tolist(), delimiter='#', names=names, header=None, na_values=[-999,-997])
+        df_aws = df_aws.drop('dummy', axis=1)
+        df_aws = df_aws.map_partitions(_scale_aws, stnid=stnid)
+        df_aws = df_aws.set_index(dd.to_datetime(df_aws['YMDHI'], format='%Y%m%d%H%M'))
     else:
-        return df_aws.compute()
+        # all files share the same format: parse them at once
+        buf = []
+        for file in filearr:
+            with open(file, 'rb') as f:
+                buf.append(f.read())
+        df_aws = pd.read_csv(BytesIO(b'\n'.join(buf)), delimiter='#', names=names, header=None, na_values=[-999,-997])
+        df_aws = df_aws.drop('dummy', axis=1)
+        df_aws = _scale_aws(df_aws, stnid=stnid)
+        df_aws = df_aws.set_index(pd.to_datetime(df_aws['YMDHI'], format='%Y%m%d%H%M'))
+    df_aws = df_aws.drop('YMDHI', axis=1)
+    
+    return df_aws
 
 
-def read_2dvd_rho(time, date_range=True, datadir='/disk/common/kwonil_rainy/RHO_2DVD/', filename='2DVD_Dapp_v_rho_201*Deq.txt'):
+def _scale_aws(df, stnid=None):
+    """
+    Select stations and convert AWS values stored in tenths into physical units.
+    """
+    if stnid:
+        df = df[df['ID'].isin(stnid)]
+    
+    cols = ['WD', 'WS', 'T', 'RH',
+            'PA', 'PS', 'RE',
+            'R60mAcc', 'R1d', 'R15m', 'R60m',
+            'WDS', 'WSS']
+    df = df.copy()
+    df[cols] = df[cols].to_numpy(dtype=np.float64) / 10.
+    
+    return df
+
+
+def read_2dvd_rho(time, date_range=True, datadir='/disk/common/kwonil_rainy/RHO_2DVD/', filename='2DVD_Dapp_v_rho_201*Deq.txt', usecols=None, nworkers=None, cache=False):
     """
     Read 2DVD density files into dataframe.
     
@@ -144,6 +155,12 @@ def read_2dvd_rho(time, date_range=True, datadir='/disk/common/kwonil_rainy/RHO_
     
     >>> df_2dvd_drop = kkpy.io.read_2dvd_rho(time=datetime.datetime(2018,2,28), filename='2DVD_rho_test_*.txt')
     
+    >>> df_2dvd_drop = kkpy.io.read_2dvd_rho(time=datetime.datetime(2018,2,28), usecols=['VEL','AREA','Deq'])
+    
+    >>> df_2dvd_drop = kkpy.io.read_2dvd_rho(time=list_of_many_datetimes, date_range=False, nworkers=64) # many files on a network mount
+    
+    >>> df_2dvd_drop = kkpy.io.read_2dvd_rho(time=[datetime.datetime(2018,1,1),datetime.datetime(2018,3,31)], cache=True) # faster from the second call
+    
     Parameters
     ----------
     time : datetime or array_like of datetime
@@ -156,6 +173,14 @@ def read_2dvd_rho(time, date_range=True, datadir='/disk/common/kwonil_rainy/RHO_
         Directory of data.
     filename : str, optional
         File naming of data.
+    usecols : list of str, optional
+        Columns to read among 'Dapp', 'VEL', 'RHO', 'AREA', 'WA', 'HA', 'WB', 'HB' and 'Deq'. Read all columns if None.
+    nworkers : int, optional
+        Number of threads reading files concurrently. Use 1 to read files one by one.
+        If None, min(32, 4*cpu_count) threads are used when there are more than 2*cpu_count files.
+    cache : bool, optional
+        If True, keep parsed data as a parquet file next to each data file (`file`.parquet) and read it instead of the text file in the next call.
+        The parquet file is ignored once the data file is modified. Requires pyarrow; caching is skipped if pyarrow is missing or the directory is not writable.
         
     Returns
     ---------
@@ -163,11 +188,11 @@ def read_2dvd_rho(time, date_range=True, datadir='/disk/common/kwonil_rainy/RHO_
         Return dataframe of 2dvd data.
     """
     # Get file list
-    filearr = np.array(np.sort(glob.glob(f'{datadir}/**/{filename}', recursive=True)))
-    yyyy_filearr = [np.int(os.path.basename(x)[-27:-23]) for x in filearr]
-    mm_filearr = [np.int(os.path.basename(x)[-23:-21]) for x in filearr]
-    dd_filearr = [np.int(os.path.basename(x)[-21:-19]) for x in filearr]
-    dt_filearr = np.array([datetime.datetime(yyyy,mm,dd) for (yyyy, mm, dd) in zip(yyyy_filearr, mm_filearr, dd_filearr)])
+    filearr = np.array(_list_files(datadir, filename, recursive=True))
+    dt_filearr = pd.to_datetime(pd.Series(filearr, dtype=object).str.slice(-27, -19), format='%Y%m%d').to_numpy()
+    isort = np.argsort(dt_filearr, kind='stable')
+    filearr = filearr[isort]
+    dt_filearr = dt_filearr[isort]
 
     if time is None:
         sys.exit(f'{__name__}: Check time argument')
@@ -181,35 +206,44 @@ def read_2dvd_rho(time, date_range=True, datadir='/disk/common/kwonil_rainy/RHO_
         if time[0] >= time[1]:
             sys.exit(f'{__name__}: time[1] must be greater than time[0]')
         
-        dt_start = datetime.datetime(time[0].year, time[0].month, time[0].day)
-        dt_finis = datetime.datetime(time[1].year, time[1].month, time[1].day)
+        dt_start = np.datetime64(datetime.datetime(time[0].year, time[0].month, time[0].day), 'ns')
+        dt_finis = np.datetime64(datetime.datetime(time[1].year, time[1].month, time[1].day), 'ns')
         
-        
-        filearr = filearr[(dt_filearr >= dt_start) & (dt_filearr <= dt_finis)]
-        dt_filearr = dt_filearr[(dt_filearr >= dt_start) & (dt_filearr <= dt_finis)]
+        # dt_filearr is sorted
+        i_start = np.searchsorted(dt_filearr, dt_start, side='left')
+        i_finis = np.searchsorted(dt_filearr, dt_finis, side='right')
+        filearr = filearr[i_start:i_finis]
+        dt_filearr = dt_filearr[i_start:i_finis]
     else:
-        list_dt_yyyymmdd = np.unique(np.array([datetime.datetime(_time.year, _time.month, _time.day) for _time in time]))
+        list_dt_yyyymmdd = np.unique(np.array([datetime.datetime(_time.year, _time.month, _time.day) for _time in time], dtype='datetime64[ns]'))
         
-        filearr = filearr[np.isin(dt_filearr, list_dt_yyyymmdd)]
-        dt_filearr = dt_filearr[np.isin(dt_filearr, list_dt_yyyymmdd)]
+        wh_dt = np.isin(dt_filearr, list_dt_yyyymmdd)
+        filearr = filearr[wh_dt]
+        dt_filearr = dt_filearr[wh_dt]
     
     if len(filearr) == 0:
         sys.exit(f'{__name__}: No matched data for the given time period')
         
     # # READ DATA
-    columns = ['hhmm', 'Dapp', 'VEL', 'RHO', 'AREA', 'WA', 'HA', 'WB', 'HB', 'Deq']
+    if nworkers is None:
+        ncpu = os.cpu_count() or 1
+        nworkers = min(32, ncpu*4) if filearr.size > 2*ncpu else 1
+    
+    if nworkers > 1:
+        executor = ThreadPoolExecutor(max_workers=nworkers)
+        mapper = executor.map
+    else:
+        executor = None
+        mapper = map
+    
     dflist = []
-    for i_file, (file, dt) in enumerate(zip(filearr, dt_filearr)):
-        _df = pd.read_csv(file, skiprows=1, names=columns, header=None, delim_whitespace=True)
-        _df['year'] = dt.year
-        _df['month'] = dt.month
-        _df['day'] = dt.day
-        _df['hour'] = np.int_(_df['hhmm'] / 100)
-        _df['minute'] = _df['hhmm'] % 100
-        _df['jultime'] = pd.to_datetime(_df[['year','month','day','hour','minute']])
-        _df = _df.drop(['hhmm','year','month','day','hour','minute'], axis=1)
-        dflist.append(_df)
-        print(i_file+1, filearr.size, file)
+    try:
+        for i_file, (file, _df) in enumerate(zip(filearr, mapper(functools.partial(_read_2dvd_rho_file, usecols=usecols, cache=cache), filearr, dt_filearr))):
+            dflist.append(_df)
+            print(i_file+1, filearr.size, file)
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     df_2dvd_drop = pd.concat(dflist, sort=False, ignore_index=True)
     df_2dvd_drop.set_index('jultime', inplace=True)
@@ -221,6 +255,99 @@ def read_2dvd_rho(time, date_range=True, datadir='/disk/common/kwonil_rainy/RHO_
     return df_2dvd_drop
 
 
+def _read_2dvd_rho_file(file, dt, usecols=None, cache=False):
+    """
+    Read a single 2DVD density file of the given date into dataframe.
+    
+    If *cache* is True, the parsed data is stored as `file`.parquet and reused while it is newer than the source file.
+    """
+    columns = ['Dapp', 'VEL', 'RHO', 'AREA', 'WA', 'HA', 'WB', 'HB', 'Deq']
+    if usecols is not None:
+        columns = [_col for _col in columns if _col in usecols]
+    
+    if not cache:
+        return _parse_2dvd_rho_file(file, dt, columns)
+    
+    pq_file = f'{file}.parquet'
+    try:
+        if os.path.getmtime(pq_file) >= os.path.getmtime(file):
+            return pd.read_parquet(pq_file, columns=columns+['jultime'])
+    except (OSError, ImportError):
+        pass
+    
+    _df = _parse_2dvd_rho_file(file, dt)
+    try:
+        # write to a temporary file first not to leave a broken cache behind
+        _df.to_parquet(f'{pq_file}.tmp', compression='zstd', index=False)
+        os.replace(f'{pq_file}.tmp', pq_file)
+    except (OSError, ImportError):
+        pass
+    
+    return _df[columns+['jultime']]
+
+
+def _parse_2dvd_rho_file(file, dt, usecols=None):
+    """
+    Parse a single 2DVD density text file of the given date into dataframe.
+    """
+    columns = ['hhmm', 'Dapp', 'VEL', 'RHO', 'AREA', 'WA', 'HA', 'WB', 'HB', 'Deq']
+    if usecols is None:
+        usecols = columns[1:]
+    usecols = ['hhmm'] + [_col for _col in columns[1:] if _col in usecols]
+    dtype = {_col: np.float64 for _col in usecols}
+    dtype['hhmm'] = np.int32
+    _df = pd.read_csv(file, skiprows=1, names=columns, header=None, sep=r'\s+', engine='c', low_memory=False, usecols=usecols, dtype=dtype)
+    
+    # jultime = date of file + hhmm, built directly in nanoseconds
+    base_ns = np.int64(pd.Timestamp(dt).value)
+    hhmm = _df['hhmm'].to_numpy(np.int64)
+    ns = base_ns + (hhmm // 100) * 3_600_000_000_000 + (hhmm % 100) * 60_000_000_000
+    _df['jultime'] = ns.view('datetime64[ns]')
+    _df = _df.drop('hhmm', axis=1)
+    
+    return _df
+
+
+def _list_files(path, pattern, recursive=False):
+    """
+    Return sorted list of files in the directory matching the shell-style pattern.
+    
+    Directory listings are cached and reused as long as the modification time of the directory is unchanged.
+    Hidden files and directories are ignored, as in glob.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return []
+    
+    names, subdirs = _scandir(path, mtime_ns)
+    files = [os.path.join(path, _name) for _name in fnmatch.filter(names, pattern)]
+    if recursive:
+        for _subdir in subdirs:
+            files.extend(_list_files(os.path.join(path, _subdir), pattern, recursive=True))
+    
+    return sorted(files)
+
+
+@functools.lru_cache(maxsize=1024)
+def _scandir(path, mtime_ns):
+    """
+    Return names of files and subdirectories in the directory. *mtime_ns* is only used as a cache key.
+    """
+    names = []
+    subdirs = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir():
+                subdirs.append(entry.name)
+            else:
+                names.append(entry.name)
+    
+    return tuple(names), tuple(subdirs)
+
+
 def read_mxpol_rhi_with_hc(rhifile_nc, hcfile_mat):
     """
     Read MXPOL RHI with hydrometeor classification into py-ART radar object.
@@ -250,12 +377,26 @@ def read_mxpol_rhi_with_hc(rhifile_nc, hcfile_mat):
     import scipy.io
     from netCDF4 import Dataset
     
+    list_str = [
+        'AG', 'CR', 'IH',
+        'LR', 'MH', 'RN',
+        'RP', 'WS']
+    list_standard = [
+        'Aggregation', 'Crystal', 'Ice hail / Graupel',
+        'Light rain', 'Melting hail', 'Rain',
+        'Rimed particles', 'Wet snow']
+    
     # HC file
-    HC_proportion = scipy.io.loadmat(hcfile_mat)
+    HC_proportion = scipy.io.loadmat(hcfile_mat, variable_names=list_str)
     # RHI file
     mxpol = Dataset(rhifile_nc,'r')
     El = mxpol.variables['Elevation'][:]
-    wh_hc = np.logical_and(El>5,El<175)
+    wh_hc = np.ma.filled(np.logical_and(El>5,El<175), False)
+    # rays of a single sweep are contiguous: index with a slice (view) rather than a mask (copy)
+    i_hc = np.argmax(wh_hc)
+    n_hc = np.count_nonzero(wh_hc)
+    if wh_hc[i_hc:i_hc+n_hc].all():
+        wh_hc = slice(i_hc, i_hc+n_hc)
     El = El[wh_hc]
     R = mxpol.variables['Range'][:]
 
@@ -263,69 +404,56 @@ def read_mxpol_rhi_with_hc(rhifile_nc, hcfile_mat):
 
     ######## HIDs ########
     # find most probable habit
-    for i, _HC in HC_proportion.items():
-        if '_' in i: continue
-            
-        if i in 'AG':
-            HC3d_proportion = np.array(HC_proportion[i])
-        else:
-            HC3d_proportion = np.dstack([HC3d_proportion, HC_proportion[i]])
-    HC = np.float_(np.argmax(HC3d_proportion, axis=2))
+    HC3d_proportion = np.stack([HC_proportion[_str] for _str in list_str], axis=-1)
+    HC = np.argmax(HC3d_proportion, axis=2).astype(np.float32)
     HC[np.isnan(HC3d_proportion[:,:,0])] = np.nan
     
-    # add to PYART radar fields
-    list_str = [
-        'AG', 'CR', 'IH',
-        'LR', 'MH', 'RN',
-        'RP', 'WS']
-    list_standard = [
-        'Aggregation', 'Crystal', 'Ice hail / Graupel',
-        'Light rain', 'Melting hail', 'Rain',
-        'Rimed particles', 'Wet snow']
+    # PYART radar fields
+    fields = {}
     for _str, _standard in zip(list_str, list_standard):
-        mask_dict = {
+        fields[_str] = {
             'data':HC_proportion[_str], 'unit':'-',
             'long_name':f'Proportion of the {_str}',
             '_FillValue':-9999, 'standard_name':_standard}
-        radar.add_field(_str, mask_dict, replace_existing=True)
     
-    radar.add_field('HC',
-                    {'data':HC, 'unit':'-',
-                     'long_name':f'Most probable habit. AG(0), CR(1), IH(2), LR(3), MH(4), RN(5), RP(6), WS(7)',
-                     '_FillValue':-9999, 'standard_name':'Hydrometeor classification'},
-                    replace_existing=True)
+    fields['HC'] = {
+        'data':HC, 'unit':'-',
+        'long_name':f'Most probable habit. AG(0), CR(1), IH(2), LR(3), MH(4), RN(5), RP(6), WS(7)',
+        '_FillValue':-9999, 'standard_name':'Hydrometeor classification'}
     
     ######## Radar variables ########
-    ZDR = mxpol.variables['Zdr'][:].T[wh_hc]
-    Z   = mxpol.variables['Zh'][:].T[wh_hc]
-    KDP = mxpol.variables['Kdp'][:].T[wh_hc]
+    # (variable, ray, gate), masks kept
+    stacked = np.ma.stack([mxpol.variables[_var][:] for _var in ('Zdr', 'Zh', 'Kdp')], axis=0).transpose(0,2,1)[:,wh_hc]
+    ZDR, Z, KDP = stacked
 
-    mask_dict = {
+    fields['KDP'] = {
         'data':KDP, 'unit':'deg/km',
         'long_name': 'differential phase shift',
         '_FillValue':-9999, 'standard_name':'KDP'
     }
-    radar.add_field('KDP', mask_dict)
 
-    mask_dict = {
+    fields['ZDR'] = {
         'data':ZDR-4.5, 'unit':'dB',
         'long_name': 'differential reflectivity',
         '_FillValue':-9999, 'standard_name':'ZDR'
     }
-    radar.add_field('ZDR', mask_dict)
 
-    mask_dict = {
+    fields['ZHH'] = {
         'data':Z, 'unit':'dBZ',
         'long_name': 'horizontal reflectivity',
         '_FillValue':-9999, 'standard_name':'ZHH'
     }
-    radar.add_field('ZHH', mask_dict)
+    
+    # same shape check as radar.add_field, done once for all fields
+    for _name, _field in fields.items():
+        if _field['data'].shape != (radar.nrays, radar.ngates):
+            raise ValueError(f'{__name__}: shape of {_name} {_field["data"].shape} does not match radar ({radar.nrays}, {radar.ngates})')
+    radar.fields.update(fields)
 
 
     radar.range['data'] = R
     radar.elevation['data'] = El
-    azimuth = np.array(mxpol['Azimuth'][:][wh_hc])
-    if azimuth[0] < 0: azimuth += 360
+    azimuth = np.mod(np.asarray(mxpol['Azimuth'][:][wh_hc], dtype=np.float32), 360.)
     radar.azimuth['data'] = azimuth
     radar.fixed_angle['data'] = azimuth
     radar.time['data'] = np.array(mxpol.variables['Time'][:])
@@ -337,7 +465,7 @@ def read_mxpol_rhi_with_hc(rhifile_nc, hcfile_mat):
     
     return radar
 
-def read_dem(file=None, area='pyeongchang'):
+def read_dem(file=None, area='pyeongchang', bbox=None):
     """
     Read NASA SRTM 3-arcsec (90 meters) digital elevation model in South Korea.
     
@@ -351,12 +479,16 @@ def read_dem(file=None, area='pyeongchang'):
     
     >>> dem, lon_dem, lat_dem, proj_dem = kkpy.io.read_dem(file='./pyeongchang_90m.tif')
     
+    >>> dem, lon_dem, lat_dem, proj_dem = kkpy.io.read_dem(area='korea', bbox=[127.5,37.0,129.0,38.0])
+    
     Parameters
     ----------
     file : str, optional
         Filepath of .tif DEM file to read.
     area : str, optional
         Region of interest. Possible options are 'pyeongchang' and 'korea'. Default is 'pyeongchang'.
+    bbox : array_like of float, optional
+        Bounding box [lon0, lat0, lon1, lat1] to read. Only the pixels within the box are read from the file. Read whole DEM if None.
         
     Returns
     ---------
@@ -368,25 +500,71 @@ def read_dem(file=None, area='pyeongchang'):
         Return latitude of each DEM pixel.
     proj_dem : osr object
         Spatial reference system of the used coordinates.
+    
+    Notes
+    ---------
+    Outputs are cached and shared between calls with the same arguments, as long as the file is not modified.
+    Returned arrays are read-only; use `.copy()` if you need to modify them.
     """
+    if file is None:
+        if area in 'pyeongchang':
+            file = '/disk/WORKSPACE/kwonil/SRTM3_V2.1/TIF/pyeongchang_90m.tif'
+        elif area in 'korea':
+            file = '/disk/WORKSPACE/kwonil/SRTM3_V2.1/TIF/korea_90m.tif'
+        else:
+            sys.exit(f'{__name__}: Check area argument')
+    
+    if bbox is not None:
+        bbox = tuple(bbox)
     
+    return _read_dem(os.path.abspath(file), bbox, os.stat(file).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _read_dem(file, bbox, mtime_ns):
+    """
+    Read DEM file into read-only arrays. *mtime_ns* is only used as a cache key.
+    """
     import wradlib as wrl
     
-    if file is not None:
-        ds = wrl.io.open_raster(file)
+    ds = wrl.io.open_raster(file)
+    if bbox is None:
+        dem, coord, proj_dem = wrl.georef.extract_raster_dataset(ds)
+        lon_dem = coord[:,:,0]
+        lat_dem = coord[:,:,1]
     else:
-        if area in 'pyeongchang':
-            ds = wrl.io.open_raster('/disk/WORKSPACE/kwonil/SRTM3_V2.1/TIF/pyeongchang_90m.tif')
-        elif area in 'korea':
-            ds = wrl.io.open_raster('/disk/WORKSPACE/kwonil/SRTM3_V2.1/TIF/korea_90m.tif')
-        else:
-            print('Please check area argument')
-            
-    dem, coord, proj_dem = wrl.georef.extract_raster_dataset(ds)
-    lon_dem = coord[:,:,0]
-    lat_dem = coord[:,:,1]
+        dem, lon_dem, lat_dem = _read_raster_window(ds, bbox)
+        proj_dem = wrl.georef.wkt_to_osr(ds.GetProjection())
     dem = dem.astype(float)
     dem[dem <= 0] = np.nan
     dem = dem.T
+    
+    for _arr in (dem, lon_dem, lat_dem):
+        _arr.flags.writeable = False
+
+    return dem, lon_dem, lat_dem, proj_dem
+
 
-    return dem, lon_dem, lat_dem, proj_dem
\ No newline at end of file
+def _read_raster_window(ds, bbox):
+    """
+    Read the first band of GDAL raster dataset within the bounding box [lon0, lat0, lon1, lat1].
+    Coordinates are those of pixel centers, assuming a north-up raster.
+    """
+    x0, dx, _, y0, _, dy = ds.GetGeoTransform()
+    lon0, lat0, lon1, lat1 = bbox
+    
+    cols = (np.array([lon0, lon1]) - x0) / dx
+    rows = (np.array([lat0, lat1]) - y0) / dy
+    col0 = max(int(np.floor(cols.min())), 0)
+    col1 = min(int(np.ceil(cols.max())), ds.RasterXSize)
+    row0 = max(int(np.floor(rows.min())), 0)
+    row1 = min(int(np.ceil(rows.max())), ds.RasterYSize)
+    if col0 >= col1 or row0 >= row1:
+        sys.exit(f'{__name__}: bbox does not overlap with DEM')
+    
+    dem = ds.GetRasterBand(1).ReadAsArray(col0, row0, col1-col0, row1-row0)
+    lon = x0 + (np.arange(col0, col1) + 0.5) * dx
+    lat = y0 + (np.arange(row0, row1) + 0.5) * dy
+    lon_dem, lat_dem = np.meshgrid(lon, lat)
+    
+    return dem, lon_dem, lat_dem